@@ -106,6 +106,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SQL_FIELD_REFERENCE_PATTERN = re.compile(r"\${([^}]+)}")
+
 
 @dataclass
 class LookerFolder:
@@ -160,20 +162,16 @@ class LookerViewId:
     def preprocess_file_path(self, file_path: str) -> str:
         new_file_path: str = str(file_path)
 
-        str_to_remove: List[str] = [
-            "\\.view\\.lkml$",  # escape the . using \
-        ]
-
-        for pattern in str_to_remove:
-            new_file_path = re.sub(pattern, "", new_file_path)
+        # These are all fixed strings, so plain string operations are enough here
+        view_file_suffix = ".view.lkml"
+        if new_file_path.endswith(view_file_suffix):
+            new_file_path = new_file_path[: -len(view_file_suffix)]
 
-        str_to_replace: Dict[str, str] = {
-            f"^imported_projects/{re.escape(self.project_name)}/": "",  # escape any special regex character present in project-name
-            "/": ".",  # / is not urn friendly
-        }
+        imported_project_prefix = f"imported_projects/{self.project_name}/"
+        if new_file_path.startswith(imported_project_prefix):
+            new_file_path = new_file_path[len(imported_project_prefix) :]
 
-        for pattern in str_to_replace:
-            new_file_path = re.sub(pattern, str_to_replace[pattern], new_file_path)
+        new_file_path = new_file_path.replace("/", ".")  # / is not urn friendly
 
         logger.debug(f"Original file path {file_path}")
         logger.debug(f"After preprocessing file path {new_file_path}")
@@ -680,8 +678,7 @@ class LookerExplore:
 
     @staticmethod
     def _get_fields_from_sql_equality(sql_fragment: str) -> List[str]:
-        field_match = re.compile(r"\${([^}]+)}")
-        return field_match.findall(sql_fragment)
+        return _SQL_FIELD_REFERENCE_PATTERN.findall(sql_fragment)
 
     @classmethod
     def from_dict(
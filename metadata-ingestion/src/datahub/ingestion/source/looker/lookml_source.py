@@ -1,4 +1,3 @@
-import copy
 import glob
 import itertools
 import logging
@@ -7,6 +6,7 @@ import re
 import tempfile
 from dataclasses import dataclass, field as dataclass_field, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import (
     Any,
     ClassVar,
@@ -111,6 +111,16 @@ _EXPLORE_FILE_EXTENSION = ".explore.lkml"
 _VIEW_FILE_EXTENSION = ".view.lkml"
 _MODEL_FILE_EXTENSION = ".model.lkml"
 
+# Matches references to columns of the underlying table, e.g. ${TABLE}.user_id
+_TABLE_FIELD_REFERENCE_PATTERN = re.compile(r"\${TABLE}\.[\"]*([\.\w]+)")
+# Matches cascading derived table references, e.g. my_view.SQL_TABLE_NAME
+_DERIVED_VIEW_REFERENCE_PATTERN = re.compile(r"\w+\.SQL_TABLE_NAME", flags=re.I)
+# Used to detect sql fragments that omit the SELECT and FROM parts of the query
+_SELECT_KEYWORD_PATTERN = re.compile(r"SELECT\s", flags=re.I)
+_FROM_KEYWORD_PATTERN = re.compile(r"FROM\s", flags=re.I)
+# Fallback table extraction for queries the sql parser can't handle
+_FROM_TABLE_PATTERN = re.compile(r"FROM\s*([a-zA-Z0-9_.`]+)")
+
 
 def deduplicate_fields(fields: List[ViewField]) -> List[ViewField]:
     # Remove duplicates filed from self.fields
@@ -120,11 +130,11 @@ def deduplicate_fields(fields: List[ViewField]) -> List[ViewField]:
     #   - Any field declared as dimension or measure can be redefined as dimension_group.
     #   - Any field declared in dimension can't be redefined in measure and vice-versa.
 
-    dimension_group_field_names: List[str] = [
+    dimension_group_field_names: Set[str] = {
         field.name
         for field in fields
         if field.field_type == ViewFieldType.DIMENSION_GROUP
-    ]
+    }
 
     new_fields: List[ViewField] = []
 
@@ -643,6 +653,8 @@ class LookerViewFileLoader:
         reporter: LookMLSourceReport,
     ) -> None:
         self.viewfile_cache: Dict[str, LookerViewFile] = {}
+        # Most recent connection-bound copy of each view file, keyed by path
+        self._bound_viewfile_cache: Dict[str, LookerViewFile] = {}
         self._root_project_name = root_project_name
         self._base_projects_folder = base_projects_folder
         self.reporter = reporter
@@ -707,7 +719,14 @@ class LookerViewFileLoader:
         if viewfile is None:
             return None
 
-        return replace(viewfile, connection=connection)
+        # The same view file is loaded many times with the same connection while
+        # resolving includes, extends and refinements, so reuse the bound copy.
+        bound_viewfile = self._bound_viewfile_cache.get(viewfile.absolute_file_path)
+        if bound_viewfile is None or bound_viewfile.connection is not connection:
+            bound_viewfile = replace(viewfile, connection=connection)
+            self._bound_viewfile_cache[viewfile.absolute_file_path] = bound_viewfile
+
+        return bound_viewfile
 
 
 class LookerRefinementResolver:
@@ -781,7 +800,8 @@ class LookerRefinementResolver:
             existing_column = original_column_map[existing_column_name]
             refine_column = refine_column_map.get(existing_column_name)
             if refine_column is not None:
-                existing_column.update(refine_column)
+                # copy on write, the original column may be shared with the raw view
+                existing_column = {**existing_column, **refine_column}
 
             merge_column.append(existing_column)
 
@@ -808,7 +828,14 @@ class LookerRefinementResolver:
         Iterate over refinement_views and merge parameter of each view with raw_view.
         Detail of merging order can be found at https://cloud.google.com/looker/docs/lookml-refinements
         """
-        new_raw_view: dict = copy.deepcopy(raw_view)
+        if not refinement_views:
+            # Nothing to merge, and the merged view is only ever read, so it can
+            # share raw_view instead of copying it.
+            return raw_view
+
+        # Only the column lists are modified by the merge, and merge_column never
+        # mutates the column dicts in place, so a shallow copy is sufficient.
+        new_raw_view: dict = {**raw_view}
 
         for refinement_view in refinement_views:
             # Merge dimension and measure
@@ -980,6 +1007,9 @@ def _find_view_from_resolved_includes(
 
 _SQL_FUNCTIONS = ["UNNEST"]
 
+# Platforms that use "db.table" naming instead of "db.schema.table"
+_TWO_PART_PLATFORMS = frozenset({"hive", "mysql", "athena"})
+
 
 @dataclass
 class LookerView:
@@ -993,7 +1023,9 @@ class LookerView:
     view_details: Optional[ViewProperties] = None
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _import_sql_parser_cls(cls, sql_parser_path: str) -> Type[SQLParser]:
+        # The parser is the same for every view in a run, so resolve it only once
         assert "." in sql_parser_path, "sql_parser-path must contain a ."
         parser_cls = import_path(sql_parser_path)
 
@@ -1002,9 +1034,13 @@ class LookerView:
         return parser_cls
 
     @classmethod
+    @lru_cache(maxsize=2048)
     def _get_sql_info(
         cls, sql: str, sql_parser_path: str, use_external_process: bool = True
     ) -> SQLInfo:
+        # Parsing is by far the most expensive step for derived tables, and the same
+        # sql is frequently shared by views (e.g. via extends), so results are cached.
+        # Callers must treat the returned SQLInfo as read-only.
         parser_cls = cls._import_sql_parser_cls(sql_parser_path)
 
         try:
@@ -1029,18 +1065,20 @@ class LookerView:
             column_names = []
 
         logger.debug(f"Column names parsed = {column_names}")
-        # Drop table names with # in them
-        sql_table_names = [t for t in sql_table_names if "#" not in t]
-
-        # Remove quotes from table names
-        sql_table_names = [t.replace('"', "") for t in sql_table_names]
-        sql_table_names = [t.replace("`", "") for t in sql_table_names]
-        # Remove reserved words from table names
-        sql_table_names = [
-            t for t in sql_table_names if t.upper() not in _SQL_FUNCTIONS
-        ]
+        # Clean up the table names in a single pass
+        cleaned_table_names: List[str] = []
+        for table_name in sql_table_names:
+            # Drop table names with # in them
+            if "#" in table_name:
+                continue
+            # Remove quotes from table names
+            table_name = table_name.replace('"', "").replace("`", "")
+            # Remove reserved words from table names
+            if table_name.upper() in _SQL_FUNCTIONS:
+                continue
+            cleaned_table_names.append(table_name)
 
-        return SQLInfo(table_names=sql_table_names, column_names=column_names)
+        return SQLInfo(table_names=cleaned_table_names, column_names=column_names)
 
     @classmethod
     def _get_fields(
@@ -1066,8 +1104,8 @@ class LookerView:
             upstream_fields = []
             if extract_column_level_lineage:
                 if field_dict.get("sql") is not None:
-                    for upstream_field_match in re.finditer(
-                        r"\${TABLE}\.[\"]*([\.\w]+)", field_dict["sql"]
+                    for upstream_field_match in _TABLE_FIELD_REFERENCE_PATTERN.finditer(
+                        field_dict["sql"]
                     ):
                         matched_field = upstream_field_match.group(1)
                         # Remove quotes from field names
@@ -1308,19 +1346,17 @@ class LookerView:
                     f"{view_name}: SQL Parsing didn't return any tables, trying a hail-mary"
                 )
                 # A hail-mary simple parse.
-                for maybe_table_match in re.finditer(
-                    r"FROM\s*([a-zA-Z0-9_.`]+)", sql_query
-                ):
+                for maybe_table_match in _FROM_TABLE_PATTERN.finditer(sql_query):
                     if maybe_table_match.group(1) not in sql_table_names:
                         sql_table_names.append(maybe_table_match.group(1))
                 return fields, sql_table_names
 
         # Looker supports sql fragments that omit the SELECT and FROM parts of the query
         # Add those in if we detect that it is missing
-        if not re.search(r"SELECT\s", sql_query, flags=re.I):
+        if not _SELECT_KEYWORD_PATTERN.search(sql_query):
             # add a SELECT clause at the beginning
             sql_query = f"SELECT {sql_query}"
-        if not re.search(r"FROM\s", sql_query, flags=re.I):
+        if not _FROM_KEYWORD_PATTERN.search(sql_query):
             # add a FROM clause at the end
             sql_query = f"{sql_query} FROM {sql_table_name if sql_table_name is not None else view_name}"
             # Get the list of tables in the query
@@ -1376,15 +1412,19 @@ class LookerView:
         # The fields in the view are actually references to the fields in the explore.
         # As such, we need to perform an extra mapping step to update
         # the upstream column names.
+        # The first explore column with a given name wins.
+        explore_column_mapping: Dict[str, str] = {}
+        for explore_column in explore_columns:
+            explore_column_mapping.setdefault(
+                explore_column["name"],
+                explore_column.get("field", explore_column["name"]),
+            )
+
         for field in fields:
-            for i, upstream_field in enumerate(field.upstream_fields):
-                # Find the matching column in the explore.
-                for explore_column in explore_columns:
-                    if explore_column["name"] == upstream_field:
-                        field.upstream_fields[i] = explore_column.get(
-                            "field", explore_column["name"]
-                        )
-                        break
+            field.upstream_fields = [
+                explore_column_mapping.get(upstream_field, upstream_field)
+                for upstream_field in field.upstream_fields
+            ]
 
         return fields, upstream_explores
 
@@ -1545,7 +1585,7 @@ class LookMLSource(StatefulIngestionSourceBase):
         return looker_model
 
     def _platform_names_have_2_parts(self, platform: str) -> bool:
-        return platform in {"hive", "mysql", "athena"}
+        return platform in _TWO_PART_PLATFORMS
 
     def _generate_fully_qualified_name(
         self, sql_table_name: str, connection_def: LookerConnectionDefinition
@@ -1559,17 +1599,19 @@ class LookMLSource(StatefulIngestionSourceBase):
         # With the exception of mysql, hive, athena which are "db.table"
 
         # first detect which one we have
-        parts = len(sql_table_name.split("."))
+        name_parts = sql_table_name.split(".")
+        parts = len(name_parts)
+        has_2_parts = self._platform_names_have_2_parts(connection_def.platform)
 
         if parts == 3:
             # fully qualified, but if platform is of 2-part, we drop the first level
-            if self._platform_names_have_2_parts(connection_def.platform):
-                sql_table_name = ".".join(sql_table_name.split(".")[1:])
+            if has_2_parts:
+                sql_table_name = ".".join(name_parts[1:])
             return sql_table_name.lower()
 
         if parts == 1:
             # Bare table form
-            if self._platform_names_have_2_parts(connection_def.platform):
+            if has_2_parts:
                 dataset_name = f"{connection_def.default_db}.{sql_table_name}"
             else:
                 dataset_name = f"{connection_def.default_db}.{connection_def.default_schema}.{sql_table_name}"
@@ -1577,7 +1619,7 @@ class LookMLSource(StatefulIngestionSourceBase):
 
         if parts == 2:
             # if this is a 2 part platform, we are fine
-            if self._platform_names_have_2_parts(connection_def.platform):
+            if has_2_parts:
                 return sql_table_name.lower()
             # otherwise we attach the default top-level container
             dataset_name = f"{connection_def.default_db}.{sql_table_name}"
@@ -1597,7 +1639,7 @@ class LookMLSource(StatefulIngestionSourceBase):
         # Check if table name matches cascading derived tables pattern
         # derived tables can be referred to using aliases that look like table_name.SQL_TABLE_NAME
         # See https://docs.looker.com/data-modeling/learning-lookml/derived-tables#syntax_for_referencing_a_derived_table
-        if re.fullmatch(r"\w+\.SQL_TABLE_NAME", sql_table_name, flags=re.I):
+        if _DERIVED_VIEW_REFERENCE_PATTERN.fullmatch(sql_table_name):
             sql_table_name = sql_table_name.lower().split(".")[0]
             # upstream dataset is a looker view based on current view id's project and model
             view_id = LookerViewId(
@@ -1679,23 +1721,26 @@ class LookMLSource(StatefulIngestionSourceBase):
         # Generate the upstream + fine grained lineage objects.
         upstreams = []
         observed_lineage_ts = datetime.now(tz=timezone.utc)
+        observed_lineage_time = int(observed_lineage_ts.timestamp() * 1000)
         fine_grained_lineages: List[FineGrainedLineageClass] = []
+        extract_column_level_lineage = self.source_config.extract_column_level_lineage and (
+            looker_view.view_details is not None
+            and looker_view.view_details.viewLanguage
+            != VIEW_LANGUAGE_SQL  # we currently only map col-level lineage for views without sql
+        )
+        view_urn = looker_view.id.get_urn(self.source_config)
         for upstream_dataset_urn in upstream_dataset_urns:
             upstream = UpstreamClass(
                 dataset=upstream_dataset_urn,
                 type=DatasetLineageTypeClass.VIEW,
                 auditStamp=AuditStampClass(
-                    time=int(observed_lineage_ts.timestamp() * 1000),
+                    time=observed_lineage_time,
                     actor=CORPUSER_DATAHUB,
                 ),
             )
             upstreams.append(upstream)
 
-            if self.source_config.extract_column_level_lineage and (
-                looker_view.view_details is not None
-                and looker_view.view_details.viewLanguage
-                != VIEW_LANGUAGE_SQL  # we currently only map col-level lineage for views without sql
-            ):
+            if extract_column_level_lineage:
                 for field in looker_view.fields:
                     if field.upstream_fields:
                         fine_grained_lineage = FineGrainedLineageClass(
@@ -1707,12 +1752,7 @@ class LookMLSource(StatefulIngestionSourceBase):
                                 for upstream_field in field.upstream_fields
                             ],
                             downstreamType=FineGrainedLineageDownstreamType.FIELD,
-                            downstreams=[
-                                make_schema_field_urn(
-                                    looker_view.id.get_urn(self.source_config),
-                                    field.name,
-                                )
-                            ],
+                            downstreams=[make_schema_field_urn(view_urn, field.name)],
                         )
                         fine_grained_lineages.append(fine_grained_lineage)
 
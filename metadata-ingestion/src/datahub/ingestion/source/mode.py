@@ -13,7 +13,8 @@ import requests
 import sqlglot
 import tenacity
 import yaml
-from liquid import Template, Undefined
+from cached_property import cached_property
+from liquid import BoundTemplate, Template, Undefined
 from pydantic import Field, validator
 from requests.models import HTTPBasicAuth, HTTPError
 from sqllineage.runner import LineageRunner
@@ -110,6 +111,29 @@ from datahub.utilities.lossy_collections import LossyDict, LossyList
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Wherever we don't resolve the jinja params, we replace it with NULL
+Undefined.__str__ = lambda self: "NULL"  # type: ignore
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(source: str) -> BoundTemplate:
+    # Parsing is the expensive part of rendering and the same query text is
+    # commonly shared by many charts, so we only parse each unique source once.
+    return Template(source)
+
+
+# Mode report parameters are declared in `{% form %} ... {% endform %}` blocks
+_FORM_BLOCK_PATTERN = re.compile(
+    r"{% form %}(.*?){% endform %}", re.MULTILINE | re.DOTALL | re.IGNORECASE
+)
+_FORM_BLOCK_REMOVAL_PATTERN = re.compile(
+    r"{% form %}(.*){% endform %}", re.MULTILINE | re.DOTALL
+)
+_DEFINITION_REFERENCE_PATTERN = re.compile(r"({{(?:\s+)?@[^}{]+}})")
+_USE_WAREHOUSE_PATTERN = re.compile(
+    r"use\s+warehouse\s+(.*)(\s+)?;", re.MULTILINE | re.DOTALL | re.IGNORECASE
+)
+
 
 class SpaceKey(ContainerKey):
     # Note that Mode has renamed Spaces to Collections.
@@ -668,8 +692,8 @@ class ModeSource(StatefulIngestionSourceBase):
 
         return platform
 
-    @lru_cache(maxsize=None)
-    def _get_data_sources(self) -> List[dict]:
+    @cached_property
+    def _data_sources(self) -> List[dict]:
         data_sources = []
         try:
             ds_json = self._get_request_json(f"{self.workspace_uri}/data_sources")
@@ -686,7 +710,7 @@ class ModeSource(StatefulIngestionSourceBase):
     def _get_platform_and_dbname(
         self, data_source_id: int
     ) -> Union[Tuple[str, str], Tuple[None, None]]:
-        data_sources = self._get_data_sources()
+        data_sources = self._data_sources
 
         if not data_sources:
             self.report.report_failure(
@@ -711,8 +735,13 @@ class ModeSource(StatefulIngestionSourceBase):
         return None, None
 
     def _replace_definitions(self, raw_query: str) -> str:
+        # Definitions are referenced as {{ @definition_name }}; most queries don't
+        # use any, so skip the regex scan when the marker can't be present.
+        if "@" not in raw_query:
+            return raw_query
+
         query = raw_query
-        definitions = re.findall(r"({{(?:\s+)?@[^}{]+}})", raw_query)
+        definitions = _DEFINITION_REFERENCE_PATTERN.findall(raw_query)
         for definition_variable in definitions:
             definition_name, definition_alias = self._parse_definition_name(
                 definition_variable
@@ -843,32 +872,28 @@ class ModeSource(StatefulIngestionSourceBase):
             field.globalTags = GlobalTagsClass(tags=[tag])
 
     def normalize_mode_query(self, query: str) -> str:
-        regex = r"{% form %}(.*?){% endform %}"
         rendered_query: str = query
         normalized_query: str = query
 
         self.report.num_query_template_render += 1
-        matches = re.findall(regex, query, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        if "{{" not in query and "{%" not in query:
+            # Nothing to render, so avoid parsing the query as a liquid template
+            self.report.num_query_template_render_success += 1
+            return query
+
+        matches = _FORM_BLOCK_PATTERN.findall(query)
         try:
             jinja_params: Dict = {}
             if matches:
                 for match in matches:
-                    definition = Template(source=match).render()
+                    definition = _compile_template(match).render()
                     parameters = yaml.safe_load(definition)
                     for key in parameters.keys():
                         jinja_params[key] = parameters[key].get("default", "")
 
-                normalized_query = re.sub(
-                    r"{% form %}(.*){% endform %}",
-                    "",
-                    query,
-                    0,
-                    re.MULTILINE | re.DOTALL,
-                )
+                normalized_query = _FORM_BLOCK_REMOVAL_PATTERN.sub("", query)
 
-            # Wherever we don't resolve the jinja params, we replace it with NULL
-            Undefined.__str__ = lambda self: "NULL"  # type: ignore
-            rendered_query = Template(normalized_query).render(jinja_params)
+            rendered_query = _compile_template(normalized_query).render(jinja_params)
             self.report.num_query_template_render_success += 1
         except Exception as e:
             logger.debug(f"Rendering query {query} failed with {e}")
@@ -953,11 +978,8 @@ class ModeSource(StatefulIngestionSourceBase):
                     continue
                 # This is hacky but on snowlake we want to change the default warehouse if use warehouse is present
                 if upstream_warehouse_platform == "snowflake":
-                    regexp = r"use\s+warehouse\s+(.*)(\s+)?;"
-                    matches = re.search(
-                        regexp,
-                        partial_query.sql(dialect=upstream_warehouse_platform),
-                        re.MULTILINE | re.DOTALL | re.IGNORECASE,
+                    matches = _USE_WAREHOUSE_PATTERN.search(
+                        partial_query.sql(dialect=upstream_warehouse_platform)
                     )
                     if matches and matches.group(1):
                         upstream_warehouse_db_name = matches.group(1)
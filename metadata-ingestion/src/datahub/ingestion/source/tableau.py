@@ -1599,7 +1599,10 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
 
         return None
 
+    @lru_cache(maxsize=None)
     def _query_published_datasource_for_project_luid(self, ds_luid: str) -> None:
+        # Memoized so that datasources whose project is not in the registry (or whose
+        # lookup failed) don't trigger another REST round-trip every time they are seen.
         if self.server is None:
             return
 
@@ -1,3 +1,4 @@
+import copy
 import logging
 import pathlib
 from typing import Any, List
@@ -252,6 +253,9 @@ def test_lookml_view_merge(pytestconfig, tmp_path, mock_time):
         },
     ]
 
+    original_raw_view: dict = copy.deepcopy(raw_view)
+    original_refinement_views: List[dict] = copy.deepcopy(refinement_views)
+
     merged_view: dict = LookerRefinementResolver.merge_refinements(
         raw_view=raw_view, refinement_views=refinement_views
     )
@@ -290,6 +294,9 @@ def test_lookml_view_merge(pytestconfig, tmp_path, mock_time):
     }
 
     assert DeepDiff(expected_view, merged_view) == {}
+    # merging must not modify the input views
+    assert DeepDiff(original_raw_view, raw_view) == {}
+    assert DeepDiff(original_refinement_views, refinement_views) == {}
 
 
 @freeze_time(FROZEN_TIME)